@@ -1,12 +1,51 @@
 """Simple text processing components for demonstration."""
 
 # examples/text_pipeline/components.py
+import heapq
+import logging
+import string
+from collections import Counter
+from operator import itemgetter
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
 from pudding.core import BaseComponent, registry
 
+try:
+    from bounter import bounter
+except ImportError:  # optional: only needed for approximate word counts
+    bounter = None
+
+logger = logging.getLogger(__name__)
+
+# Texts longer than this aggregate word lengths over distinct words only
+LARGE_TEXT_THRESHOLD = 65536
+
+
+class _CleanTable(dict):
+    """str.translate table: lowercase ASCII, keep letters/digits/whitespace.
+
+    Code points missing from the table are resolved on first lookup and
+    memoized: unmapped ASCII and any whitespace is kept, the rest dropped.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        keep = codepoint < 128 or chr(codepoint).isspace()
+        value = codepoint if keep else None
+        self[codepoint] = value
+        return value
+
+
+# Built once at import and shared by every TextCleaner
+_SPECIAL_ASCII = "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c.isspace())
+)
+_XLATE = _CleanTable(
+    str.maketrans(string.ascii_uppercase, string.ascii_lowercase, _SPECIAL_ASCII)
+)
+_UPPERS = frozenset(string.ascii_uppercase)
+
 
 # Schemas
 class TextInput(BaseModel):
@@ -69,21 +108,15 @@ class TextCleaner(BaseComponent[TextInput, CleanedText]):
         original = input_data.text
         changes = []
 
-        # Remove extra whitespace
-        cleaned = " ".join(original.split())
-        if cleaned != original:
-            changes.append("removed_extra_whitespace")
+        # Lowercase and strip special characters in a single pass
+        translated = original.translate(_XLATE)
+        cleaned = " ".join(translated.split())
 
-        # Convert to lowercase for consistency
-        cleaned = cleaned.lower()
-        if cleaned != original.lower():
+        if cleaned != translated:
+            changes.append("removed_extra_whitespace")
+        if not _UPPERS.isdisjoint(original):
             changes.append("converted_to_lowercase")
-
-        # Remove special characters (keep only letters, numbers, spaces)
-        import re
-
-        cleaned = re.sub(r"[^a-z0-9\s]", "", cleaned)
-        if len(cleaned) != len(original):
+        if len(translated) != len(original):
             changes.append("removed_special_characters")
 
         return CleanedText(text=cleaned, source=input_data.source, changes_made=changes)
@@ -92,7 +125,7 @@ class TextCleaner(BaseComponent[TextInput, CleanedText]):
 class WordCounter(BaseComponent[CleanedText, WordStats]):
     """Counts words and generates statistics."""
 
-    def __init__(self):
+    def __init__(self, approximate: bool = False, size_mb: int = 64):
         super().__init__(
             name="word_counter",
             version="1.0.0",
@@ -101,26 +134,42 @@ class WordCounter(BaseComponent[CleanedText, WordStats]):
         )
         registry.register(self.name, self.version, "CleanedText", "WordStats")
 
+        # Approximate counting keeps memory bounded on very large corpora
+        if approximate and bounter is None:
+            logger.warning("bounter is not installed, using exact word counts")
+        self.approximate = approximate and bounter is not None
+        self.size_mb = size_mb
+
     async def process(self, input_data: CleanedText) -> WordStats:
         """Generate word statistics."""
         words = input_data.text.split()
 
         # Count frequencies
-        from collections import Counter
-
-        word_counts = Counter(words)
+        if self.approximate:
+            word_counts = bounter(size_mb=self.size_mb)
+            word_counts.update(words)
+            unique_words = word_counts.cardinality()
+            most_common = heapq.nlargest(5, word_counts.items(), key=itemgetter(1))
+            total_chars = sum(map(len, words))
+        else:
+            counter = Counter(words)
+            unique_words = len(counter)
+            most_common = counter.most_common(5)
+            if len(input_data.text) > LARGE_TEXT_THRESHOLD:
+                # Large texts repeat words heavily, so weighting each distinct
+                # word by its count touches far fewer items than all words
+                total_chars = sum(len(word) * n for word, n in counter.items())
+            else:
+                total_chars = sum(map(len, words))
 
         # Calculate stats
         total_words = len(words)
-        unique_words = len(word_counts)
-        avg_length = (
-            sum(len(word) for word in words) / total_words if total_words > 0 else 0
-        )
+        avg_length = total_chars / total_words if total_words > 0 else 0
 
         return WordStats(
             total_words=total_words,
             unique_words=unique_words,
             average_word_length=round(avg_length, 2),
-            most_common_words=word_counts.most_common(5),
+            most_common_words=most_common,
             source=input_data.source,
         )
@@ -106,7 +106,7 @@ async def demo_chaining_methods():
     print(f"   Success: {result_c.error is None}")
 
     print("\n3. Method C: Load specific sample file")
-    samples = cleaner.list_samples("output")
+    samples = cleaner.list_samples("output", limit=1)
     if samples:
         result_d = await counter.run(
             (cleaner, samples[0])
@@ -1,15 +1,19 @@
 """Pudding - A novel pipeline framework for debuggable data processing."""
 
-from .core import (
-    BaseComponent,
-    ComponentMetadata,
-    ComponentResult,
-    DataEnvelope,
-    DataType,
-    RunConfig,
-    SampleSaveMode,
-    registry,
-)
+from typing import TYPE_CHECKING, Any
+
+from . import core
+from .core import RunConfig, SampleSaveMode, registry
+
+if TYPE_CHECKING:
+    from .core import (
+        BaseComponent,
+        ComponentMetadata,
+        ComponentResult,
+        DataEnvelope,
+        DataType,
+        LineageEntry,
+    )
 
 __version__ = "0.1.1"
 
@@ -19,7 +23,21 @@ __all__ = [
     "SampleSaveMode",
     "DataEnvelope",
     "DataType",
+    "LineageEntry",
     "ComponentResult",
     "ComponentMetadata",
     "registry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer pydantic-backed names to pudding.core's lazy loader
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(core, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
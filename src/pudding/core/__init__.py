@@ -1,18 +1,54 @@
 """Core components of the pudding pipeline framework."""
 
 # src/pudding/core/__init__.py
-from .base_component import BaseComponent
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .config import RunConfig, SampleSaveMode
-from .data_envelope import ComponentMetadata, ComponentResult, DataEnvelope, DataType
 from .registry import registry
 
+if TYPE_CHECKING:
+    from .base_component import BaseComponent
+    from .data_envelope import (
+        ComponentMetadata,
+        ComponentResult,
+        DataEnvelope,
+        DataType,
+        LineageEntry,
+    )
+
+# Names whose modules import pydantic; loaded on first access so that
+# config and registry use stays cheap to import
+_LAZY = {
+    "BaseComponent": ".base_component",
+    "DataEnvelope": ".data_envelope",
+    "DataType": ".data_envelope",
+    "LineageEntry": ".data_envelope",
+    "ComponentResult": ".data_envelope",
+    "ComponentMetadata": ".data_envelope",
+}
+
 __all__ = [
     "BaseComponent",
     "RunConfig",
     "SampleSaveMode",
     "DataEnvelope",
     "DataType",
+    "LineageEntry",
     "ComponentResult",
     "ComponentMetadata",
     "registry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip this hook
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
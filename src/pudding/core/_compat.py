@@ -0,0 +1,8 @@
+"""Compatibility helpers for the supported Python versions."""
+
+# src/pudding/core/_compat.py
+import sys
+from typing import Any
+
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,17 +1,42 @@
 """Base component framework for all pipeline components."""
 
 # src/pudding/core/base_component.py
+import asyncio
+import datetime as dt
+import functools
+import hashlib
+import heapq
 import json
 import logging
+import os
+import time
+import types
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import OrderedDict
+from decimal import Decimal
+from enum import Enum
 from pathlib import Path
-from typing import Any, Generic, Optional, TypeVar
-
-from pydantic import BaseModel
-
-from .config import RunConfig, SampleSaveMode
-from .data_envelope import ComponentMetadata, ComponentResult, DataEnvelope, DataType
+from typing import Any, Generic, Literal, Optional, TypeVar, Union, get_args, get_origin
+from uuid import UUID
+
+from pydantic.main import BaseModel
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # optional: only needed for compressed samples
+    lz4_frame = None
+
+from .config import RunConfig
+from .data_envelope import (
+    COMPONENT_INPUT,
+    COMPONENT_OUTPUT,
+    RAW_DATA,
+    ComponentMetadata,
+    ComponentResult,
+    DataEnvelope,
+    DataType,
+    LineageEntry,
+)
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -20,10 +45,112 @@ logger = logging.getLogger(__name__)
 TInput = TypeVar("TInput", bound=BaseModel)
 TOutput = TypeVar("TOutput", bound=BaseModel)
 
+# Maximum number of memoized outputs kept per component
+RESULT_CACHE_SIZE = 128
+
+# Background saves are written in batches of up to SAVE_BATCH_SIZE samples
+# collected within SAVE_BATCH_WINDOW seconds
+SAVE_BATCH_SIZE = 64
+SAVE_BATCH_WINDOW = 0.01
+
+# Sample file extensions, plain and LZ4-compressed JSON
+_SAMPLE_SUFFIXES = (".json", ".json.lz4")
+
+# Create-only flags so a sample filename is claimed atomically
+_SAMPLE_OPEN_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+# Field types that model_dump() returns unchanged
+_FLAT_TYPES: tuple[type, ...] = (str, int, float, bool, bytes, type(None))
+_FLAT_TYPES += (dt.datetime, dt.date, dt.time, dt.timedelta, Decimal, UUID)
+# Annotation wrappers over those types; containers are excluded because
+# model_dump() copies them and envelope data must not share them
+_FLAT_CONTAINERS: tuple[Any, ...] = (Union,)
+if hasattr(types, "UnionType"):  # X | Y annotations on Python 3.10+
+    _FLAT_CONTAINERS += (types.UnionType,)
+
+
+def _is_flat_annotation(annotation: Any) -> bool:
+    """Check that a field annotation contains no models or other dumpable types."""
+    origin = get_origin(annotation)
+    if origin is None:
+        return isinstance(annotation, type) and (
+            issubclass(annotation, _FLAT_TYPES) or issubclass(annotation, Enum)
+        )
+    if origin is Literal:
+        return True
+    if origin not in _FLAT_CONTAINERS:
+        return False
+    return all(
+        arg is Ellipsis or _is_flat_annotation(arg) for arg in get_args(annotation)
+    )
+
+
+@functools.cache
+def _is_flat_model(model: type[BaseModel]) -> bool:
+    """Check whether model_dump() of this model equals a copy of its __dict__."""
+    decorators = model.__pydantic_decorators__
+    if (
+        model.model_config.get("extra") == "allow"
+        or model.model_config.get("serialize_by_alias")
+        or model.model_computed_fields
+        or decorators.field_serializers
+        or decorators.model_serializers
+    ):
+        return False
+    return all(
+        not field.metadata
+        and not field.exclude
+        and getattr(field, "exclude_if", None) is None
+        and field.alias is None
+        and field.serialization_alias is None
+        and _is_flat_annotation(field.annotation)
+        for field in model.model_fields.values()
+    )
+
+
+# Local time prefix of the second the last sample timestamp was taken in
+_timestamp_prefix: tuple[int, str] = (-1, "")
+
+
+def _sample_timestamp() -> str:
+    """Format the current local time as YYYYmmdd_HHMMSS_mmm for sample names."""
+    global _timestamp_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_prefix
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y%m%d_%H%M%S", time.localtime(seconds))
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}_{nanos // 1_000_000:03d}"
+
+
+def _lz4_available(compress: bool) -> bool:
+    """Check whether a compressed sample can be written, warning if not."""
+    if compress and lz4_frame is None:
+        logger.warning("lz4 is not installed, saving sample uncompressed")
+        return False
+    return compress
+
+
+# Sample directories already created by this process
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process, skipping mkdir on later calls."""
+    key = path.absolute()
+    if key not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
 
 class BaseComponent(ABC, Generic[TInput, TOutput]):
     """Abstract base class for all pipeline components."""
 
+    # Set to True for components whose output is a pure function of their
+    # input; run() then memoizes results. Off by default because building the
+    # cache key costs more than a cheap process() call.
+    deterministic: bool = False
+
     def __init__(
         self,
         name: str,
@@ -36,13 +163,30 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
         self.version = version
         self.input_schema = input_schema
         self.output_schema = output_schema
+        self._input_schema_name = input_schema.__name__
+        self._output_schema_name = output_schema.__name__
+        self._output_is_flat = _is_flat_model(output_schema)
 
         # Set up sample data directory
         if sample_data_dir:
             self.sample_data_dir = Path(sample_data_dir)
         else:
             self.sample_data_dir = Path.cwd() / "sample_data" / name
-        self.sample_data_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.sample_data_dir)
+
+        # Memoized outputs keyed by input hash, in LRU order
+        self._result_cache: OrderedDict[str, TOutput] = OrderedDict()
+
+        # Latest sample filename per data type, with the directory mtime it
+        # was resolved at
+        self._latest_cache: dict[DataType, tuple[float, str]] = {}
+
+        # Base filename of the last saved sample and the next counter for it
+        self._last_save: tuple[str, int] = ("", 0)
+
+        # Background sample writer, started lazily by the first queued save
+        self._save_queue: Optional[asyncio.Queue[tuple[Any, ...]]] = None
+        self._save_task: Optional[asyncio.Task[None]] = None
 
         logger.info(f"Initialized {name} v{version}")
 
@@ -90,7 +234,8 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
             # Handle empty argument - use latest input
             if input_source is None:
                 logger.info(f"🔄 REPLAY MODE: Using latest saved input for {self.name}")
-                envelope = self._get_latest_envelope(DataType.COMPONENT_INPUT)
+                await self.flush_saves()
+                envelope = self._get_latest_envelope(COMPONENT_INPUT)
                 if not envelope:
                     raise ValueError(f"No saved inputs found for {self.name}")
                 metadata.is_replay = True
@@ -101,7 +246,7 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
                 metadata.input_source_type = self._get_source_type_name(input_source)
 
             # Update metadata with lineage
-            metadata.data_lineage = envelope.lineage.copy()
+            metadata.data_lineage = envelope.lineage
 
             # Check compatibility
             if not config.skip_compatibility_check:
@@ -119,28 +264,42 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
             input_dict = envelope.data
             transformed_input = self.prepare_input(input_dict)
 
-            # Validate input
-            validated_input = self.input_schema(**transformed_input)
+            # Reuse the output of an identical earlier call if possible
+            cache_key = self._get_cache_key(transformed_input, config, process_kwargs)
+            cached_output = self._result_cache.get(cache_key) if cache_key else None
 
-            # Save input sample if requested
-            if config.save_samples & SampleSaveMode.INPUT:
-                self._save_sample(
-                    DataType.COMPONENT_INPUT,
-                    transformed_input,
-                    metadata,
-                    prefix=config.sample_name_prefix,
-                )
+            if cache_key and cached_output is not None:
+                self._result_cache.move_to_end(cache_key)
+                metadata.is_cached = True
+                # Copy so callers mutating one result cannot alter later ones
+                validated_output = cached_output.model_copy(deep=True)
+            else:
+                # Validate input
+                validated_input = self.input_schema(**transformed_input)
 
-            # Execute core processing
-            raw_output = await self.process(validated_input, **process_kwargs)
+                # Save input sample if requested
+                if config._save_input:
+                    self._submit_save(
+                        config, COMPONENT_INPUT, transformed_input, metadata
+                    )
 
-            # Validate output
-            if isinstance(raw_output, self.output_schema):
-                validated_output = raw_output
-            else:
-                validated_output = self.output_schema.model_validate(
-                    raw_output.model_dump()
-                )
+                # Execute core processing
+                raw_output = await self.process(validated_input, **process_kwargs)
+
+                # Validate output
+                if isinstance(raw_output, self.output_schema):
+                    validated_output = raw_output
+                else:
+                    validated_output = self.output_schema.model_validate(
+                        raw_output, from_attributes=True
+                    )
+
+                if cache_key:
+                    self._result_cache[cache_key] = validated_output.model_copy(
+                        deep=True
+                    )
+                    if len(self._result_cache) > RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
 
             # Create output envelope
             output_envelope = self._create_output_envelope(
@@ -153,12 +312,9 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
             )
 
             # Save output sample if requested
-            if config.save_samples & SampleSaveMode.OUTPUT:
-                self._save_sample(
-                    DataType.COMPONENT_OUTPUT,
-                    validated_output.model_dump(),
-                    metadata,
-                    prefix=config.sample_name_prefix,
+            if config._save_output:
+                self._submit_save(
+                    config, COMPONENT_OUTPUT, output_envelope.data, metadata
                 )
 
             if config.debug_mode:
@@ -172,16 +328,41 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
 
             return ComponentResult(data=None, metadata=metadata, error=error_msg)
 
+    def _get_cache_key(
+        self,
+        input_dict: dict[str, Any],
+        config: RunConfig,
+        process_kwargs: dict[str, Any],
+    ) -> Optional[str]:
+        """Get memoization key for an input, or None if the run must not be cached."""
+        if (
+            not self.deterministic
+            or process_kwargs
+            or config.debug_mode
+            or config.execution_id is not None
+            or config._save_input
+            or config._save_output
+        ):
+            return None
+
+        try:
+            payload = json.dumps(input_dict, sort_keys=True)
+        except (TypeError, ValueError):
+            # Not JSON-serializable, so there is no stable key
+            return None
+
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
     def can_process(self, envelope: DataEnvelope) -> tuple[bool, Optional[str]]:
         """Check if this component can process the given data."""
         # Basic implementation - can be overridden
-        if envelope.schema_name and envelope.schema_name != self.input_schema.__name__:
+        if envelope.schema_name and envelope.schema_name != self._input_schema_name:
             # Check if we have prepare_input that might handle it
             if self.prepare_input.__name__ != BaseComponent.prepare_input.__name__:
                 return True, "Will transform using prepare_input()"
             return (
                 False,
-                f"Schema mismatch: expects {self.input_schema.__name__}, got {envelope.schema_name}",
+                f"Schema mismatch: expects {self._input_schema_name}, got {envelope.schema_name}",
             )
         return True, None
 
@@ -204,19 +385,20 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
             if input_source.envelope:
                 return input_source.envelope
             else:
-                return DataEnvelope(
-                    data_type=DataType.COMPONENT_OUTPUT,
+                return DataEnvelope.construct_trusted(
+                    data_type=COMPONENT_OUTPUT,
                     component_name=input_source.metadata.component_name,
                     component_version=input_source.metadata.component_version,
                     data=input_source.data.model_dump() if input_source.data else {},
                     execution_id=input_source.metadata.execution_id,
-                    timestamp=input_source.metadata.executed_at,
+                    timestamp_ns=input_source.metadata.executed_at_ns,
                     lineage=input_source.metadata.data_lineage,
                 )
 
         # Another component - load its latest output
         elif isinstance(input_source, BaseComponent):
-            envelope = input_source._get_latest_envelope(DataType.COMPONENT_OUTPUT)
+            await input_source.flush_saves()
+            envelope = input_source._get_latest_envelope(COMPONENT_OUTPUT)
             if not envelope:
                 raise ValueError(f"No output samples found for {input_source.name}")
             logger.info(f"Loading latest output from {input_source.name}")
@@ -224,20 +406,21 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
 
         # BaseModel - wrap in envelope
         elif isinstance(input_source, BaseModel):
-            return DataEnvelope(
-                data_type=DataType.RAW_DATA,
+            return DataEnvelope.construct_trusted(
+                data_type=RAW_DATA,
                 data=input_source.model_dump(),
                 schema_name=input_source.__class__.__name__,
             )
 
         # Dict - wrap in envelope
         elif isinstance(input_source, dict):
-            return DataEnvelope(data_type=DataType.RAW_DATA, data=input_source)
+            return DataEnvelope(data_type=RAW_DATA, data=input_source)
 
         # Tuple of (component, sample_name)
         elif isinstance(input_source, tuple) and len(input_source) == 2:
             component, sample_name = input_source
             if isinstance(component, BaseComponent):
+                await component.flush_saves()
                 return component.load_sample(sample_name)
             else:
                 raise ValueError(
@@ -247,58 +430,174 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
         else:
             raise ValueError(f"Unsupported input source type: {type(input_source)}")
 
+    def _submit_save(
+        self,
+        config: RunConfig,
+        sample_type: DataType,
+        data: dict[str, Any],
+        metadata: ComponentMetadata,
+    ) -> None:
+        """Save a sample now, or queue it for the background writer."""
+        prefix = config.sample_name_prefix
+        compress = _lz4_available(config.compress_samples)
+
+        # Serialize before returning, so later changes to data by the caller
+        # cannot reach a sample that is written in the background
+        payload = self._dump_sample(sample_type, data, metadata, compress)
+        if not config.background_saves:
+            self._write_sample(sample_type, payload, prefix, compress)
+            return
+
+        # Restart the writer if it is missing or its event loop has finished
+        if self._save_task is None or self._save_task.done():
+            self._save_queue = asyncio.Queue()
+            self._save_task = asyncio.create_task(self._save_worker(self._save_queue))
+
+        assert self._save_queue is not None
+        self._save_queue.put_nowait((sample_type, payload, prefix, compress))
+
+    async def _save_worker(self, queue: "asyncio.Queue[tuple[Any, ...]]") -> None:
+        """Write queued samples in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        batch: list[tuple[Any, ...]] = []
+        try:
+            while True:
+                batch.append(await queue.get())
+
+                # Coalesce saves that arrive within a short window
+                while len(batch) < SAVE_BATCH_SIZE:
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(queue.get(), SAVE_BATCH_WINDOW)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+                # An executor job keeps running if we are cancelled meanwhile,
+                # so the submitted batch must not be written again below
+                submitted, batch = batch, []
+                try:
+                    await loop.run_in_executor(None, self._save_batch, submitted)
+                finally:
+                    for _ in submitted:
+                        queue.task_done()
+        except asyncio.CancelledError:
+            # The event loop is shutting down (e.g. asyncio.run() returned
+            # without flush_saves()); write what is pending instead of losing it
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            self._save_batch(batch)
+            for _ in batch:
+                queue.task_done()
+            raise
+
+    def _save_batch(self, batch: list[tuple[Any, ...]]) -> None:
+        """Save a batch of queued samples, logging failures individually."""
+        for sample_type, *args in batch:
+            try:
+                self._write_sample(sample_type, *args)
+            except Exception:
+                logger.exception(f"{self.name}: Failed to save {sample_type}")
+
+    async def flush_saves(self) -> None:
+        """Wait until all queued background sample saves are written.
+
+        Await this before reading samples from outside pudding. Saves still
+        queued when the event loop shuts down are written synchronously
+        during task cancellation.
+        """
+        if self._save_queue is not None and self._save_task is not None:
+            if not self._save_task.done():
+                await self._save_queue.join()
+
     def _save_sample(
         self,
         sample_type: DataType,
         data: dict[str, Any],
         metadata: ComponentMetadata,
         prefix: Optional[str] = None,
+        compress: bool = False,
     ) -> None:
-        """Save sample data as DataEnvelope."""
-        envelope = DataEnvelope(
+        """Save sample data as DataEnvelope, LZ4-compressed if requested."""
+        compress = _lz4_available(compress)
+        payload = self._dump_sample(sample_type, data, metadata, compress)
+        self._write_sample(sample_type, payload, prefix, compress)
+
+    def _dump_sample(
+        self,
+        sample_type: DataType,
+        data: dict[str, Any],
+        metadata: ComponentMetadata,
+        compress: bool = False,
+    ) -> bytes:
+        """Serialize sample data as a DataEnvelope, compact if it will be compressed."""
+        envelope = DataEnvelope.construct_trusted(
             data_type=sample_type,
             component_name=self.name,
             component_version=self.version,
-            schema_name=self.input_schema.__name__
-            if sample_type == DataType.COMPONENT_INPUT
-            else self.output_schema.__name__,
+            schema_name=self._input_schema_name
+            if sample_type == COMPONENT_INPUT
+            else self._output_schema_name,
             execution_id=metadata.execution_id,
-            timestamp=metadata.executed_at,
+            timestamp_ns=metadata.executed_at_ns,
             data=data,
             lineage=metadata.data_lineage,
         )
 
+        # Values JSON cannot represent are written as str()
+        if compress:
+            return envelope.dump_json(fallback=str).encode("utf-8")
+        return envelope.dump_json(indent=2, fallback=str).encode("utf-8")
+
+    def _write_sample(
+        self,
+        sample_type: DataType,
+        payload: bytes,
+        prefix: Optional[str] = None,
+        compress: bool = False,
+    ) -> None:
+        """Write a serialized sample to a new file, LZ4-compressing it if requested."""
         # Create filename with microseconds and counter to prevent collisions
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[
-            :-3
-        ]  # Include milliseconds
-        type_prefix = "input" if sample_type == DataType.COMPONENT_INPUT else "output"
+        timestamp = _sample_timestamp()  # Include milliseconds
+        type_prefix = "input" if sample_type == COMPONENT_INPUT else "output"
 
         if prefix:
             base_filename = f"{prefix}_{type_prefix}_{timestamp}"
         else:
             base_filename = f"{type_prefix}_{timestamp}"
 
-        # Add counter if file exists
-        counter = 0
+        extension = ".json.lz4" if compress else ".json"
+
+        # Add counter if file exists, resuming from the last counter used for
+        # the same base name. O_EXCL claims the name atomically.
+        last_base, counter = self._last_save
+        if last_base != base_filename:
+            counter = 0
         while True:
             if counter == 0:
-                filename = f"{base_filename}.json"
+                filename = f"{base_filename}{extension}"
             else:
-                filename = f"{base_filename}_{counter:03d}.json"
+                filename = f"{base_filename}_{counter:03d}{extension}"
 
             filepath = self.sample_data_dir / filename
-            if not filepath.exists():
-                break
-            counter += 1
+            try:
+                fd = os.open(filepath, _SAMPLE_OPEN_FLAGS, 0o644)
+            except FileExistsError:
+                counter += 1
+                continue
+            except FileNotFoundError:
+                # Directory was removed after it was first created
+                self.sample_data_dir.mkdir(parents=True, exist_ok=True)
+                continue
+            break
+        self._last_save = (base_filename, counter + 1)
 
         # Save envelope
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(
-                envelope.model_dump(), f, indent=2, default=str, ensure_ascii=False
-            )
+        with os.fdopen(fd, "wb") as f:
+            f.write(lz4_frame.compress(payload) if compress else payload)
+        self._latest_cache.pop(sample_type, None)
 
-        logger.info(f"💾 {self.name}: Saved {sample_type.value} to {filepath}")
+        logger.info(f"💾 {self.name}: Saved {sample_type} to {filepath}")
 
     def load_sample(self, filename: str) -> DataEnvelope:
         """Load sample data and return as DataEnvelope."""
@@ -310,21 +609,39 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
         if not filepath.exists():
             raise FileNotFoundError(f"Sample file not found: {filename}")
 
-        with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
+        raw = filepath.read_bytes()
+        if filepath.suffix == ".lz4":
+            if lz4_frame is None:
+                raise ImportError(f"lz4 is required to load {filename}")
+            raw = lz4_frame.decompress(raw)
 
-        return DataEnvelope(**data)
+        return DataEnvelope.from_json(raw)
 
     def _get_latest_envelope(self, data_type: DataType) -> Optional[DataEnvelope]:
         """Get the most recent DataEnvelope of specified type."""
-        prefix = "input_" if data_type == DataType.COMPONENT_INPUT else "output_"
-        pattern = f"{prefix}*.json"
-        files = list(self.sample_data_dir.glob(pattern))
+        # The directory mtime changes whenever a sample is added or removed,
+        # so a matching mtime means the cached filename is still the latest
+        try:
+            dir_mtime = self.sample_data_dir.stat().st_mtime
+        except FileNotFoundError:
+            # Removed after _ensure_dir() remembered it; nothing saved yet
+            return None
+        cached = self._latest_cache.get(data_type)
+        if cached and cached[0] == dir_mtime:
+            return self.load_sample(cached[1])
+
+        prefix = "input_" if data_type == COMPONENT_INPUT else "output_"
+        files = [
+            f
+            for f in self.sample_data_dir.glob(f"{prefix}*")
+            if f.name.endswith(_SAMPLE_SUFFIXES)
+        ]
 
         if not files:
             return None
 
         latest = max(files, key=lambda f: f.stat().st_mtime)
+        self._latest_cache[data_type] = (dir_mtime, latest.name)
         return self.load_sample(latest.name)
 
     def _log_data_source(self, envelope: DataEnvelope, is_replay: bool = False) -> None:
@@ -341,7 +658,7 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
             parts.append(f"Schema: {envelope.schema_name}")
 
         if envelope.data_tags:
-            parts.append(f"Tags: {envelope.data_tags}")
+            parts.append(f"Tags: {', '.join(sorted(envelope.data_tags))}")
 
         logger.info(" | ".join(parts))
 
@@ -352,24 +669,25 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
         input_envelope: DataEnvelope,
     ) -> DataEnvelope:
         """Create output envelope with updated lineage."""
-        lineage = input_envelope.lineage.copy()
-        lineage.append(
-            {
-                "component": self.name,
-                "version": self.version,
-                "timestamp": metadata.executed_at.isoformat(),
-                "execution_id": metadata.execution_id or "",
-            }
+        lineage = input_envelope.lineage + (
+            LineageEntry(
+                component=self.name,
+                version=self.version,
+                timestamp=metadata.executed_at.isoformat(),
+                execution_id=metadata.execution_id or "",
+            ),
         )
 
-        return DataEnvelope(
-            data_type=DataType.COMPONENT_OUTPUT,
+        return DataEnvelope.construct_trusted(
+            data_type=COMPONENT_OUTPUT,
             component_name=self.name,
             component_version=self.version,
-            schema_name=self.output_schema.__name__,
+            schema_name=self._output_schema_name,
             execution_id=metadata.execution_id,
-            timestamp=metadata.executed_at,
-            data=output_data.model_dump(),
+            timestamp_ns=metadata.executed_at_ns,
+            data=dict(output_data.__dict__)
+            if self._output_is_flat
+            else output_data.model_dump(),
             lineage=lineage,
         )
 
@@ -390,12 +708,23 @@ class BaseComponent(ABC, Generic[TInput, TOutput]):
         else:
             return "unknown"
 
-    def list_samples(self, sample_type: Optional[str] = None) -> list[str]:
-        """List available sample files."""
-        if sample_type:
-            pattern = f"{sample_type}_*.json"
-        else:
-            pattern = "*.json"
+    def list_samples(
+        self, sample_type: Optional[str] = None, limit: Optional[int] = None
+    ) -> list[str]:
+        """List available sample files in name order, optionally only the first `limit`."""
+        prefix = f"{sample_type}_" if sample_type else ""
 
-        files = sorted(self.sample_data_dir.glob(pattern))
-        return [f.name for f in files]
+        try:
+            with os.scandir(self.sample_data_dir) as entries:
+                names = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.name.endswith(_SAMPLE_SUFFIXES)
+                ]
+        except FileNotFoundError:
+            return []
+
+        if limit is None:
+            return sorted(names)
+        return heapq.nsmallest(limit, names)
@@ -0,0 +1,38 @@
+"""Columnar views over batches of envelopes for numeric aggregation."""
+
+# src/pudding/core/batch.py
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as e:  # optional: only needed for batch aggregation
+    raise ImportError(
+        "pudding.core.batch requires numpy: pip install 'pudding[batch]'"
+    ) from e
+
+from .data_envelope import DataEnvelope
+
+
+def envelopes_to_soa(
+    envelopes: Sequence[DataEnvelope],
+    fields: Sequence[str],
+    dtype: Any = np.float64,
+) -> dict[str, "np.ndarray[Any, Any]"]:
+    """Extract numeric `data` fields into one contiguous array per field.
+
+    Row i of every column comes from envelopes[i]; a missing field raises
+    KeyError.
+    """
+    count = len(envelopes)
+    return {
+        name: np.fromiter(
+            (envelope.data[name] for envelope in envelopes), dtype=dtype, count=count
+        )
+        for name in fields
+    }
+
+
+def sum_field(soa: dict[str, "np.ndarray[Any, Any]"], name: str) -> Any:
+    """Sum one column of a structure-of-arrays batch."""
+    return soa[name].sum()
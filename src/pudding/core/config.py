@@ -1,10 +1,11 @@
 """Configuration classes for component execution."""
 
 # src/pudding/core/config.py
+from dataclasses import dataclass, field
 from enum import Flag, auto
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from ._compat import DATACLASS_SLOTS
 
 
 class SampleSaveMode(Flag):
@@ -16,7 +17,8 @@ class SampleSaveMode(Flag):
     BOTH = INPUT | OUTPUT
 
 
-class RunConfig(BaseModel):
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class RunConfig:
     """Configuration for component execution"""
 
     # Debugging options
@@ -35,9 +37,17 @@ class RunConfig(BaseModel):
     # Sample storage options
     sample_name_prefix: Optional[str] = None
     compress_samples: bool = False
+    background_saves: bool = False  # write samples off the run() critical path
 
-    class Config:
-        arbitrary_types_allowed = True
+    # Derived from save_samples once, so run() only reads plain booleans
+    _save_input: bool = field(init=False, repr=False, compare=False)
+    _save_output: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass, so derived fields are set through object.__setattr__
+        mode = self.save_samples
+        object.__setattr__(self, "_save_input", bool(mode & SampleSaveMode.INPUT))
+        object.__setattr__(self, "_save_output", bool(mode & SampleSaveMode.OUTPUT))
 
     # Convenience factory methods
     @classmethod
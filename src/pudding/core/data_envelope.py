@@ -1,24 +1,131 @@
 """Core data structures for self-describing data."""
 
 # src/pudding/core/data_envelope.py
-from datetime import datetime, timezone
-from enum import Enum
-from typing import Any, Generic, Optional, TypeVar
+import json
+import sys
+import time
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Any, Generic, Literal, Optional, TypeVar, Union
 
-from pydantic import BaseModel, Field
+# Concrete submodules, so names resolve once instead of through
+# pydantic/__init__.py's lazy attribute hook
+from pydantic.config import ConfigDict
+from pydantic.fields import Field, PrivateAttr, computed_field
+from pydantic.functional_validators import (
+    BeforeValidator,
+    field_validator,
+    model_validator,
+)
+from pydantic.main import BaseModel
+from pydantic.type_adapter import TypeAdapter
 
+try:
+    import orjson
 
-class DataType(str, Enum):
-    """Types of data that can be wrapped in DataEnvelope"""
+    _HAS_ORJSON = True
+except ImportError:  # optional: speeds up DataEnvelope.to_json_bytes() for numpy
+    _HAS_ORJSON = False
 
-    COMPONENT_INPUT = "component_input"
-    COMPONENT_OUTPUT = "component_output"
-    RAW_DATA = "raw_data"
+from ._compat import DATACLASS_SLOTS
+
+# Default options for DataEnvelope.dump()/dump_json(), built once
+_DEFAULT_DUMP: dict[str, Any] = {"exclude_none": True}
+_DEFAULT_JSON: dict[str, Any] = {"exclude_none": True}
+
+if _HAS_ORJSON:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+
+
+def _holds_ndarray(data: dict[str, Any]) -> bool:
+    """Check for top-level numpy arrays without importing numpy."""
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return False
+    for value in data.values():
+        if isinstance(value, numpy.ndarray):
+            return True
+    return False
+
+
+def _json_fallback(value: Any) -> Any:
+    """Encode numpy arrays and scalars, which pydantic cannot serialize."""
+    if type(value).__module__ == "numpy":
+        return value.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+_BYTES_JSON: dict[str, Any] = {**_DEFAULT_JSON, "fallback": _json_fallback}
+
+
+def _orjson_default(value: Any) -> Any:
+    """Encode types orjson has no native support for."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+# Parses the pre-timestamp_ns "timestamp" field exactly as the old
+# `timestamp: datetime` field did (ISO strings, unix seconds or ms)
+_LEGACY_TIMESTAMP = TypeAdapter(datetime)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_ns(value: datetime) -> int:
+    """Convert a datetime (naive means UTC) to integer epoch nanoseconds."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND * 1_000
+
+
+def _from_ns(ns: int) -> datetime:
+    """Convert integer epoch nanoseconds to an aware UTC datetime."""
+    return _EPOCH + ns // 1_000 * _MICROSECOND
+
+
+# Types of data that can be wrapped in DataEnvelope
+DataType = Literal["component_input", "component_output", "raw_data"]
+
+COMPONENT_INPUT: DataType = "component_input"
+COMPONENT_OUTPUT: DataType = "component_output"
+RAW_DATA: DataType = "raw_data"
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class LineageEntry:
+    """One processing step recorded in an envelope's lineage"""
+
+    component: str
+    version: str = ""
+    timestamp: str = ""
+    execution_id: str = ""
+
+
+def _intern_tags(value: Any) -> Any:
+    """Intern each tag so membership checks compare by pointer."""
+    if isinstance(value, (list, tuple, set, frozenset)) and all(
+        isinstance(tag, str) for tag in value
+    ):
+        return frozenset(map(sys.intern, value))
+    return value  # anything else is left for frozenset[str] validation to reject
+
+
+# Set of interned tag strings; accepts any iterable of str on input
+DataTags = Annotated[frozenset[str], BeforeValidator(_intern_tags)]
 
 
 class DataEnvelope(BaseModel):
     """Universal wrapper for all data with rich metadata"""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
     envelope_version: str = "1.0"
     data_type: DataType
 
@@ -27,49 +134,177 @@ class DataEnvelope(BaseModel):
     component_version: Optional[str] = None
 
     # Data classification
-    data_tags: list[str] = Field(default_factory=list)
+    data_tags: DataTags = frozenset()
     schema_name: Optional[str] = None
     schema_version: Optional[str] = None
 
     # Execution context
     execution_id: Optional[str] = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Epoch nanoseconds; files written before this field existed only
+    # carry the datetime "timestamp", which is converted as a fallback
+    timestamp_ns: int = Field(default_factory=time.time_ns)
     source_info: Optional[dict[str, Any]] = None
 
     # Lineage tracking
-    lineage: list[dict[str, str]] = Field(default_factory=list)
+    lineage: tuple[LineageEntry, ...] = ()
 
     # The actual data
     data: dict[str, Any]
 
-    class Config:
-        arbitrary_types_allowed = True
+    @model_validator(mode="before")
+    @classmethod
+    def _convert_legacy_timestamp(cls, data: Any) -> Any:
+        if (
+            isinstance(data, dict)
+            and "timestamp_ns" not in data
+            and data.get("timestamp") is not None
+        ):
+            data = dict(data)
+            data["timestamp_ns"] = _to_ns(
+                _LEGACY_TIMESTAMP.validate_python(data.pop("timestamp"))
+            )
+        return data
+
+    @field_validator("lineage")
+    @classmethod
+    def _intern_lineage(
+        cls, value: tuple[LineageEntry, ...]
+    ) -> tuple[LineageEntry, ...]:
+        # Loaded lineages repeat the same few names on every hop; share them
+        return tuple(
+            LineageEntry(
+                sys.intern(entry.component),
+                sys.intern(entry.version),
+                entry.timestamp,
+                sys.intern(entry.execution_id),
+            )
+            for entry in value
+        )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as an aware UTC datetime."""
+        return _from_ns(self.timestamp_ns)
+
+    # Lazily computed by __hash__
+    _hash: Optional[int] = PrivateAttr(default=None)
+
+    def __hash__(self) -> int:
+        # Hash identity fields only; the data payload is an unhashable dict
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self.data_type,
+                    self.timestamp_ns,
+                    self.component_name,
+                    self.component_version,
+                    self.execution_id,
+                    self.schema_name,
+                    self.schema_version,
+                    self.data_tags,
+                )
+            )
+        return self._hash
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "DataEnvelope":
+        copy = super().model_copy(update=update, deep=deep)
+        copy._hash = None  # the cached hash may not match the updated fields
+        return copy
+
+    def __eq__(self, other: object) -> bool:
+        # Compare fields only, so whether the hash is cached does not matter
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
 
+    @classmethod
+    def construct_trusted(cls, **kwargs: Any) -> "DataEnvelope":
+        """Build an envelope from already-validated data, skipping validation.
 
-class ComponentMetadata(BaseModel):
+        Only for data produced inside the pipeline; use the regular
+        constructor for anything loaded from outside.
+        """
+        return cls.model_construct(**kwargs)
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "DataEnvelope":
+        """Parse and validate an envelope from JSON in one pydantic-core pass."""
+        return cls.model_validate_json(raw)
+
+    def dump(self, **kwargs: Any) -> dict[str, Any]:
+        """Dump to a dict, omitting unset (None) fields by default."""
+        if not kwargs:
+            return self.model_dump(**_DEFAULT_DUMP)
+        return self.model_dump(**{**_DEFAULT_DUMP, **kwargs})
+
+    def dump_json(self, **kwargs: Any) -> str:
+        """Dump to a JSON string, omitting unset (None) fields by default."""
+        if not kwargs:
+            return self.model_dump_json(**_DEFAULT_JSON)
+        return self.model_dump_json(**{**_DEFAULT_JSON, **kwargs})
+
+    def to_json_bytes(self) -> bytes:
+        """Dump to compact JSON bytes.
+
+        Payloads holding numpy arrays go through orjson when it is
+        installed, which encodes them natively; for everything else
+        pydantic's own serializer is faster.
+        """
+        if _HAS_ORJSON and _holds_ndarray(self.data):
+            return orjson.dumps(
+                self.dump(), default=_orjson_default, option=_ORJSON_OPTIONS
+            )
+        return self.model_dump_json(**_BYTES_JSON).encode()
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ComponentMetadata:
     """Metadata tracked for each component execution"""
 
     component_name: str
     component_version: str
-    executed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    executed_at_ns: int = field(default_factory=time.time_ns)
     execution_id: Optional[str] = None
     debug_mode: bool = False
     input_source_type: Optional[str] = None
     is_replay: bool = False
-    data_lineage: list[dict[str, str]] = Field(default_factory=list)
+    is_cached: bool = False
+    data_lineage: tuple[LineageEntry, ...] = ()
+
+    @property
+    def executed_at(self) -> datetime:
+        """Execution time as an aware UTC datetime."""
+        return _from_ns(self.executed_at_ns)
 
 
 TOutput = TypeVar("TOutput", bound=BaseModel)
 
 
-class ComponentResult(BaseModel, Generic[TOutput]):
+@dataclass(**DATACLASS_SLOTS)
+class ComponentResult(Generic[TOutput]):
     """Wrapper for component results with metadata and error handling."""
 
-    data: Optional[TOutput] = None
     metadata: ComponentMetadata
+    data: Optional[TOutput] = None
     error: Optional[str] = None
-    warnings: list[str] = Field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
     envelope: Optional[DataEnvelope] = None
 
-    class Config:
-        arbitrary_types_allowed = True
+    def to_dict(self, mode: Literal["python", "json"] = "python") -> dict[str, Any]:
+        """Convert to a dict; mode="json" keeps only JSON-compatible values."""
+        return {
+            "metadata": asdict(self.metadata),
+            "data": None if self.data is None else self.data.model_dump(mode=mode),
+            "error": self.error,
+            "warnings": list(self.warnings),
+            "envelope": None
+            if self.envelope is None
+            else self.envelope.dump(mode=mode),
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Serialize to a JSON string; kwargs are passed to json.dumps()."""
+        return json.dumps(self.to_dict(mode="json"), **kwargs)
@@ -0,0 +1,64 @@
+"""msgspec twin of DataEnvelope for fast transport and cache storage."""
+
+# src/pudding/core/envelope_msg.py
+from typing import Any, Optional, Union
+
+try:
+    import msgspec
+except ImportError as e:  # optional: only needed for msgspec transport
+    raise ImportError(
+        "pudding.core.envelope_msg requires msgspec: pip install 'pudding[transport]'"
+    ) from e
+
+from .data_envelope import DataEnvelope, DataType, LineageEntry
+
+
+class DataEnvelopeMsg(msgspec.Struct, kw_only=True, omit_defaults=True, gc=False):
+    """Wire representation of DataEnvelope with the same fields."""
+
+    envelope_version: str = "1.0"
+    data_type: DataType
+
+    # Component context
+    component_name: Optional[str] = None
+    component_version: Optional[str] = None
+
+    # Data classification
+    data_tags: frozenset[str] = frozenset()
+    schema_name: Optional[str] = None
+    schema_version: Optional[str] = None
+
+    # Execution context
+    execution_id: Optional[str] = None
+    timestamp_ns: int
+    source_info: Optional[dict[str, Any]] = None
+
+    # Lineage tracking
+    lineage: tuple[LineageEntry, ...] = ()
+
+    # The actual data
+    data: dict[str, Any]
+
+    @classmethod
+    def from_pydantic(cls, envelope: DataEnvelope) -> "DataEnvelopeMsg":
+        """Convert a DataEnvelope, sharing its field values."""
+        return cls(**{name: getattr(envelope, name) for name in cls.__struct_fields__})
+
+    def to_pydantic(self) -> DataEnvelope:
+        """Convert to a DataEnvelope; fields were already validated by msgspec."""
+        return DataEnvelope.construct_trusted(**msgspec.structs.asdict(self))
+
+
+# Encoder and decoder are reusable, so build them once
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(DataEnvelopeMsg)
+
+
+def encode_envelope(envelope: DataEnvelope) -> bytes:
+    """Serialize a DataEnvelope to JSON bytes via msgspec."""
+    return _encoder.encode(DataEnvelopeMsg.from_pydantic(envelope))
+
+
+def decode_envelope(raw: Union[str, bytes]) -> DataEnvelope:
+    """Parse and validate JSON into a DataEnvelope via msgspec."""
+    return _decoder.decode(raw).to_pydantic()
@@ -2,53 +2,128 @@
 
 # src/pudding/core/registry.py
 import logging
-from typing import Any, Optional
+import sys
+from collections import OrderedDict, defaultdict
+from typing import NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of can_connect() results kept per registry
+CONNECT_CACHE_SIZE = 4096
+
+
+class _ComponentRecord(NamedTuple):
+    """Registered component details."""
+
+    version: str
+    input_schema: str
+    output_schema: str
+
 
 class ComponentRegistry:
     """Simple registry for component tracking."""
 
     def __init__(self) -> None:
-        self._components: dict[str, dict[str, Any]] = {}
+        self._components: dict[str, _ComponentRecord] = {}
+
+        # Schema name -> names of components consuming/producing it
+        self._by_input_schema: defaultdict[str, set[str]] = defaultdict(set)
+        self._by_output_schema: defaultdict[str, set[str]] = defaultdict(set)
+
+        # (from, to) -> can_connect() result, least recently used first;
+        # cleared whenever a registration changes
+        self._connect_cache: OrderedDict[
+            tuple[str, str], tuple[bool, Optional[str]]
+        ] = OrderedDict()
 
     def register(
         self, name: str, version: str, input_schema: str, output_schema: str
     ) -> None:
         """Register a component."""
-        self._components[name] = {
-            "version": version,
-            "input_schema": input_schema,
-            "output_schema": output_schema,
-        }
+        # Interned names make lookups and schema comparisons pointer checks
+        name = sys.intern(name)
+        input_schema = sys.intern(input_schema)
+        output_schema = sys.intern(output_schema)
+
+        record = _ComponentRecord(version, input_schema, output_schema)
+        previous = self._components.get(name)
+        if previous == record:
+            return  # unchanged, so indexes and cached results still hold
+
+        # Drop index entries from a previous registration under this name
+        if previous:
+            self._by_input_schema[previous.input_schema].discard(name)
+            self._by_output_schema[previous.output_schema].discard(name)
+
+        self._by_input_schema[input_schema].add(name)
+        self._by_output_schema[output_schema].add(name)
+        self._components[name] = record
+        self._connect_cache.clear()
         logger.info(f"Registered component: {name} v{version}")
 
     def can_connect(
         self, from_component: str, to_component: str
     ) -> tuple[bool, Optional[str]]:
         """Check if two components can be connected."""
-        if from_component not in self._components:
+        key = (from_component, to_component)
+        result = self._connect_cache.get(key)
+        if result is not None:
+            self._connect_cache.move_to_end(key)
+            return result
+
+        result = self._connect_cache[key] = self._check_connect(
+            from_component, to_component
+        )
+        if len(self._connect_cache) > CONNECT_CACHE_SIZE:
+            self._connect_cache.popitem(last=False)
+        return result
+
+    def _check_connect(
+        self, from_component: str, to_component: str
+    ) -> tuple[bool, Optional[str]]:
+        """Uncached body of can_connect()."""
+        from_info = self._components.get(from_component)
+        if from_info is None:
             return False, f"Component '{from_component}' not registered"
 
-        if to_component not in self._components:
+        to_info = self._components.get(to_component)
+        if to_info is None:
             return False, f"Component '{to_component}' not registered"
 
-        from_info = self._components[from_component]
-        to_info = self._components[to_component]
-
-        if from_info["output_schema"] == to_info["input_schema"]:
+        if from_info.output_schema == to_info.input_schema:
             return True, None
 
         return (
             False,
-            f"Schema mismatch: {from_component} outputs {from_info['output_schema']}, {to_component} expects {to_info['input_schema']}",
+            f"Schema mismatch: {from_component} outputs {from_info.output_schema}, {to_component} expects {to_info.input_schema}",
         )
 
     def list_components(self) -> list[str]:
         """List all registered components."""
         return list(self._components.keys())
 
+    def components_accepting(self, schema_name: str) -> list[str]:
+        """List components whose input schema is `schema_name`."""
+        return sorted(self._by_input_schema.get(schema_name, ()))
+
+    def components_producing(self, schema_name: str) -> list[str]:
+        """List components whose output schema is `schema_name`."""
+        return sorted(self._by_output_schema.get(schema_name, ()))
+
+    def consumers_of(self, name: str) -> list[str]:
+        """List components that accept `name`'s output as their input."""
+        info = self._components.get(name)
+        if info is None:
+            return []
+        return self.components_accepting(info.output_schema)
+
+    def producers_of(self, name: str) -> list[str]:
+        """List components whose output `name` accepts as its input."""
+        info = self._components.get(name)
+        if info is None:
+            return []
+        return self.components_producing(info.input_schema)
+
 
 # Global registry instance
 registry = ComponentRegistry()
@@ -0,0 +1,290 @@
+"""Tests for BaseComponent."""
+
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from pudding.core import (
+    ComponentMetadata,
+    DataEnvelope,
+    RunConfig,
+    SampleSaveMode,
+    base_component,
+)
+from pudding.core.base_component import BaseComponent
+
+
+class Message(BaseModel):
+    text: str
+
+
+class Tagged(BaseModel):
+    text: str
+    tags: list[str]
+
+
+class TaggingComponent(BaseComponent[Message, Tagged]):
+    deterministic = True
+
+    def __init__(self, sample_data_dir: Path):
+        super().__init__(
+            "tagger", "1.0.0", Message, Tagged, sample_data_dir=sample_data_dir
+        )
+        self.calls = 0
+
+    async def process(self, input_data: Message) -> Tagged:
+        self.calls += 1
+        return Tagged(text=input_data.text, tags=["a"])
+
+
+class AliasedOutput(BaseModel):
+    model_config = ConfigDict(serialize_by_alias=True)
+
+    text: str = Field(serialization_alias="TEXT")
+    internal: str = Field(default="secret", exclude=True)
+
+
+class AliasedComponent(BaseComponent[Message, AliasedOutput]):
+    def __init__(self, sample_data_dir: Path):
+        super().__init__(
+            "aliased", "1.0.0", Message, AliasedOutput, sample_data_dir=sample_data_dir
+        )
+
+    async def process(self, input_data: Message) -> AliasedOutput:
+        return AliasedOutput(text=input_data.text)
+
+
+@pytest.mark.parametrize(
+    "field_kwargs",
+    [{"exclude": True}, {"serialization_alias": "A"}, {"alias": "A"}],
+)
+def test_fields_needing_model_dump_are_not_flat(field_kwargs):
+    """Excluded and aliased fields force the model_dump() path."""
+
+    class Output(BaseModel):
+        a: int = Field(default=1, **field_kwargs)
+
+    assert not base_component._is_flat_model(Output)
+    assert base_component._is_flat_model(Message)
+
+
+def test_container_fields_are_not_flat():
+    """Models with container fields are dumped so envelopes get their own copy."""
+    assert not base_component._is_flat_model(Tagged)
+
+
+async def test_mutating_result_data_leaves_envelope_unchanged(tmp_path):
+    """The output envelope does not share containers with result.data."""
+    component = TaggingComponent(tmp_path)
+
+    result = await component.run({"text": "x"})
+    result.data.tags.append("MUT")
+
+    assert result.envelope.data == {"text": "x", "tags": ["a"]}
+
+
+def test_output_envelope_data_matches_model_dump(tmp_path):
+    """Envelope data honours exclude=True and serialize_by_alias."""
+    component = AliasedComponent(tmp_path)
+    output = AliasedOutput(text="hi")
+    metadata = ComponentMetadata(component_name="aliased", component_version="1.0.0")
+    input_envelope = DataEnvelope(data_type="raw_data", data={"text": "hi"})
+
+    envelope = component._create_output_envelope(output, metadata, input_envelope)
+
+    assert envelope.data == output.model_dump() == {"TEXT": "hi"}
+
+
+async def test_memoized_run_hits_and_misses(tmp_path):
+    """Identical inputs reuse the cached output; new inputs call process()."""
+    component = TaggingComponent(tmp_path)
+
+    first = await component.run({"text": "x"})
+    second = await component.run({"text": "x"})
+    third = await component.run({"text": "y"})
+
+    assert component.calls == 2
+    assert not first.metadata.is_cached
+    assert second.metadata.is_cached
+    assert not third.metadata.is_cached
+    assert second.data == first.data
+
+
+async def test_memoized_results_do_not_share_state(tmp_path):
+    """Mutating one result leaves cached and later results untouched."""
+    component = TaggingComponent(tmp_path)
+
+    first = await component.run({"text": "x"})
+    first.data.tags.append("MUT")
+    second = await component.run({"text": "x"})
+    second.data.tags.append("MUT2")
+    third = await component.run({"text": "x"})
+
+    assert third.metadata.is_cached
+    assert third.data.tags == ["a"]
+
+
+async def test_memoized_results_evict_least_recently_used(tmp_path, monkeypatch):
+    """The oldest unused entry is dropped once the cache is full."""
+    monkeypatch.setattr(base_component, "RESULT_CACHE_SIZE", 2)
+    component = TaggingComponent(tmp_path)
+
+    await component.run({"text": "a"})
+    await component.run({"text": "b"})
+    await component.run({"text": "a"})  # "b" is now least recently used
+    await component.run({"text": "c"})  # evicts "b"
+    assert component.calls == 3
+
+    assert (await component.run({"text": "a"})).metadata.is_cached
+    assert not (await component.run({"text": "b"})).metadata.is_cached
+    assert component.calls == 4
+
+
+async def test_non_deterministic_component_bypasses_cache(tmp_path):
+    """deterministic = False runs process() every time."""
+    component = TaggingComponent(tmp_path)
+    component.deterministic = False
+
+    await component.run({"text": "x"})
+    result = await component.run({"text": "x"})
+
+    assert component.calls == 2
+    assert not result.metadata.is_cached
+
+
+BACKGROUND_SAVES = RunConfig(save_samples=SampleSaveMode.BOTH, background_saves=True)
+
+
+async def test_flush_saves_writes_every_queued_sample(tmp_path):
+    """flush_saves() returns once all background saves are on disk."""
+    component = TaggingComponent(tmp_path)
+
+    for i in range(5):
+        await component.run({"text": str(i)}, config=BACKGROUND_SAVES)
+    await component.flush_saves()
+
+    assert len(component.list_samples("input")) == 5
+    assert len(component.list_samples("output")) == 5
+
+
+async def test_background_saves_ignore_later_mutations(tmp_path):
+    """Samples hold the data as it was at run(), not when the writer gets to it."""
+    component = TaggingComponent(tmp_path)
+    payload = {"text": "x", "items": ["a"]}
+
+    result = await component.run(payload, config=BACKGROUND_SAVES)
+    payload["items"].append("LATE")
+    result.data.tags.append("LATE")
+    await component.flush_saves()
+
+    (input_name,) = component.list_samples("input")
+    (output_name,) = component.list_samples("output")
+    assert component.load_sample(input_name).data == {"text": "x", "items": ["a"]}
+    assert component.load_sample(output_name).data == {"text": "x", "tags": ["a"]}
+
+
+def test_background_saves_survive_event_loop_shutdown(tmp_path):
+    """Saves still queued when asyncio.run() returns are not dropped."""
+    component = TaggingComponent(tmp_path)
+
+    async def main() -> None:
+        for i in range(5):
+            await component.run({"text": str(i)}, config=BACKGROUND_SAVES)
+
+    asyncio.run(main())
+
+    assert len(component.list_samples()) == 10
+
+
+async def test_removed_sample_dir_reads_as_empty(tmp_path):
+    """A sample directory deleted after first use behaves like an empty one."""
+    sample_dir = tmp_path / "samples"
+    TaggingComponent(sample_dir)
+    shutil.rmtree(sample_dir)
+    component = TaggingComponent(sample_dir)
+
+    assert component.list_samples() == []
+    result = await component.run()
+    assert result.error is not None
+    assert "No saved inputs found" in result.error
+
+
+# Sample file as written by pudding 0.1.1 (json.dump of model_dump(), default=str)
+BASELINE_SAMPLE = """{
+  "envelope_version": "1.0",
+  "data_type": "component_output",
+  "component_name": "tagger",
+  "component_version": "1.0.0",
+  "data_tags": [],
+  "schema_name": "Tagged",
+  "schema_version": null,
+  "execution_id": "local_run",
+  "timestamp": "2025-06-07 10:11:12.123456+00:00",
+  "source_info": null,
+  "lineage": [
+    {
+      "component": "tagger",
+      "version": "1.0.0",
+      "timestamp": "2025-06-07T10:11:12.123456+00:00",
+      "execution_id": "local_run"
+    }
+  ],
+  "data": {"text": "x", "tags": ["a"]}
+}"""
+
+
+def test_load_baseline_sample_file(tmp_path):
+    """Samples saved before timestamp_ns existed still load unchanged."""
+    (tmp_path / "output_20250607_101112_123.json").write_text(BASELINE_SAMPLE)
+    component = TaggingComponent(tmp_path)
+
+    envelope = component.load_sample("output_20250607_101112_123.json")
+
+    assert envelope.timestamp_ns == 1749291072123456000
+    assert envelope.timestamp.isoformat() == "2025-06-07T10:11:12.123456+00:00"
+    assert envelope.lineage[0].component == "tagger"
+    assert envelope.data == {"text": "x", "tags": ["a"]}
+
+
+class Opaque:
+    def __str__(self) -> str:
+        return "<opaque>"
+
+
+async def test_non_json_input_values_are_saved_as_strings(tmp_path):
+    """Values JSON cannot represent are stringified rather than failing the save."""
+    component = TaggingComponent(tmp_path)
+    config = RunConfig(save_samples=SampleSaveMode.INPUT)
+
+    result = await component.run({"text": "x", "extra": Opaque()}, config=config)
+
+    assert result.error is None
+    (name,) = component.list_samples("input")
+    assert component.load_sample(name).data == {"text": "x", "extra": "<opaque>"}
+
+
+@pytest.mark.parametrize("compress", [False, True])
+async def test_saved_samples_round_trip(tmp_path, compress):
+    """Saved samples are listed and load back with the same data."""
+    if compress:
+        pytest.importorskip("lz4")
+    component = TaggingComponent(tmp_path)
+    config = RunConfig(save_samples=SampleSaveMode.BOTH, compress_samples=compress)
+
+    result = await component.run({"text": "x"}, config=config)
+
+    suffix = ".json.lz4" if compress else ".json"
+    (input_name,) = component.list_samples("input")
+    (output_name,) = component.list_samples("output")
+    assert input_name.endswith(suffix)
+    assert output_name.endswith(suffix)
+
+    input_envelope = component.load_sample(input_name)
+    output_envelope = component.load_sample(output_name)
+    assert input_envelope.data_type == "component_input"
+    assert input_envelope.data == {"text": "x"}
+    assert output_envelope.data == result.data.model_dump()
+    assert output_envelope.timestamp_ns == result.metadata.executed_at_ns
@@ -0,0 +1,32 @@
+"""Tests for columnar envelope batches."""
+
+import pytest
+
+from pudding.core import DataEnvelope
+
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("pudding.core.batch")
+
+
+def test_envelopes_to_soa_builds_one_column_per_field():
+    """Row i of each column comes from envelope i."""
+    envelopes = [
+        DataEnvelope(data_type="raw_data", data={"count": i, "score": i / 2})
+        for i in range(4)
+    ]
+
+    soa = batch.envelopes_to_soa(envelopes, ["count", "score"])
+
+    assert list(soa) == ["count", "score"]
+    assert soa["count"].dtype == np.float64
+    np.testing.assert_array_equal(soa["count"], [0, 1, 2, 3])
+    np.testing.assert_array_equal(soa["score"], [0, 0.5, 1, 1.5])
+    assert batch.sum_field(soa, "count") == 6
+
+
+def test_envelopes_to_soa_rejects_missing_field():
+    """A field absent from any envelope raises KeyError."""
+    envelopes = [DataEnvelope(data_type="raw_data", data={"count": 1})]
+
+    with pytest.raises(KeyError):
+        batch.envelopes_to_soa(envelopes, ["score"])
@@ -0,0 +1,186 @@
+"""Tests for DataEnvelope and related data structures."""
+
+import json
+import sys
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pudding.core import (
+    ComponentMetadata,
+    ComponentResult,
+    DataEnvelope,
+    LineageEntry,
+)
+from pudding.core import data_envelope as data_envelope_module
+from pudding.core.data_envelope import COMPONENT_INPUT
+
+
+def make_envelope() -> DataEnvelope:
+    return DataEnvelope(
+        data_type="component_output",
+        component_name="cleaner",
+        component_version="1.0.0",
+        data_tags=["b", "a"],
+        schema_name="CleanedText",
+        execution_id="run-1",
+        lineage=[LineageEntry("cleaner", "1.0.0", "2025-06-07T10:11:12Z", "run-1")],
+        data={"text": "hi", "counts": {"hi": 1}},
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json_bytes_round_trips(monkeypatch, use_orjson):
+    """to_json_bytes() output loads back to an equal envelope."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(data_envelope_module, "_HAS_ORJSON", use_orjson)
+    envelope = make_envelope()
+
+    raw = envelope.to_json_bytes()
+
+    assert isinstance(raw, bytes)
+    assert DataEnvelope.from_json(raw) == envelope
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json_bytes_encodes_numpy(monkeypatch, use_orjson):
+    """Numpy arrays and scalars are written as plain JSON lists and numbers."""
+    np = pytest.importorskip("numpy")
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(data_envelope_module, "_HAS_ORJSON", use_orjson)
+    envelope = DataEnvelope(
+        data_type="raw_data",
+        data={"x": np.arange(3), "nested": {"mean": np.float64(1.5)}},
+    )
+
+    data = json.loads(envelope.to_json_bytes())["data"]
+
+    assert data == {"x": [0, 1, 2], "nested": {"mean": 1.5}}
+
+
+def test_msgspec_twin_round_trips():
+    """The msgspec codec reads dump_json() output and writes what from_json reads."""
+    pytest.importorskip("msgspec")
+    from pudding.core import envelope_msg
+
+    envelope = make_envelope()
+
+    assert envelope_msg.decode_envelope(envelope.dump_json()) == envelope
+    assert DataEnvelope.from_json(envelope_msg.encode_envelope(envelope)) == envelope
+
+
+@pytest.mark.parametrize(
+    "legacy, expected_ns",
+    [
+        ("2025-06-07T10:11:12Z", 1749291072_000000000),
+        (1749291072, 1749291072_000000000),
+        (1749291072.5, 1749291072_500000000),
+        ("1749291072", 1749291072_000000000),
+    ],
+)
+def test_legacy_timestamp_is_read_as_datetime(legacy, expected_ns):
+    """A legacy "timestamp" keeps its old meaning (ISO or unix seconds)."""
+    envelope = DataEnvelope(data_type="raw_data", data={}, timestamp=legacy)
+
+    assert envelope.timestamp_ns == expected_ns
+
+
+def test_timestamp_ns_takes_precedence_over_timestamp():
+    """New dumps carry both fields; timestamp_ns is the source of truth."""
+    envelope = make_envelope()
+
+    assert DataEnvelope.from_json(envelope.dump_json()).timestamp_ns == (
+        envelope.timestamp_ns
+    )
+
+
+def test_data_tags_are_an_interned_frozenset():
+    """Tags from any list of strings become a frozenset of interned strings."""
+    tag = "".join(["ta", "g"])
+    envelope = DataEnvelope(data_type="raw_data", data={}, data_tags=[tag, "tag"])
+
+    assert envelope.data_tags == frozenset({"tag"})
+    assert next(iter(envelope.data_tags)) is sys.intern("tag")
+
+
+@pytest.mark.parametrize("tags", [None, [1], "tag"])
+def test_invalid_data_tags_raise_validation_error(tags):
+    """Bad tag values fail validation instead of raising TypeError."""
+    with pytest.raises(ValidationError):
+        DataEnvelope(data_type="raw_data", data={}, data_tags=tags)
+
+
+def test_data_type_accepts_known_strings_only():
+    """data_type is a plain string checked against the known data types."""
+    envelope = DataEnvelope(data_type=COMPONENT_INPUT, data={})
+
+    assert envelope.data_type == "component_input"
+    with pytest.raises(ValidationError):
+        DataEnvelope(data_type="bogus", data={})
+
+
+class Output(BaseModel):
+    text: str
+
+
+def make_result() -> ComponentResult[Output]:
+    metadata = ComponentMetadata(
+        component_name="cleaner",
+        component_version="1.0.0",
+        executed_at_ns=1749291072_000000000,
+        data_lineage=(LineageEntry("cleaner", "1.0.0"),),
+    )
+    return ComponentResult(
+        metadata=metadata, data=Output(text="hi"), envelope=make_envelope()
+    )
+
+
+def test_component_result_construction_defaults():
+    """Only metadata is required; the rest defaults to an empty result."""
+    metadata = ComponentMetadata(component_name="c", component_version="1")
+    result: ComponentResult[Output] = ComponentResult(metadata=metadata)
+
+    assert result.data is None
+    assert result.error is None
+    assert result.warnings == []
+    assert result.envelope is None
+    assert metadata.executed_at.tzinfo is not None
+    assert not metadata.is_cached
+
+
+def test_component_result_to_dict():
+    """to_dict() dumps nested models and dataclasses."""
+    result = make_result()
+
+    as_dict = result.to_dict()
+
+    assert as_dict["data"] == {"text": "hi"}
+    assert as_dict["metadata"]["component_name"] == "cleaner"
+    assert as_dict["metadata"]["data_lineage"][0]["component"] == "cleaner"
+    assert as_dict["envelope"]["data"] == {"text": "hi", "counts": {"hi": 1}}
+    assert as_dict["error"] is None
+
+
+def test_component_result_to_json():
+    """to_json() emits JSON matching to_dict(mode="json")."""
+    result = make_result()
+
+    loaded = json.loads(result.to_json())
+
+    assert loaded == json.loads(json.dumps(result.to_dict(mode="json")))
+    assert DataEnvelope.model_validate(loaded["envelope"]) == result.envelope
+
+
+def test_envelope_hash_separates_envelopes_of_one_run():
+    """Inputs and outputs of the same execution hash differently."""
+    output = make_envelope()
+    hash(output)  # copies below must not reuse the cached hash
+    same = DataEnvelope.from_json(output.dump_json())
+    input_ = output.model_copy(update={"data_type": "component_input"})
+    later = output.model_copy(update={"timestamp_ns": output.timestamp_ns + 1})
+
+    assert hash(same) == hash(output)
+    assert len({output, same, input_, later}) == 3
+    assert len({hash(output), hash(input_), hash(later)}) == 3
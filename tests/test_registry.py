@@ -0,0 +1,90 @@
+"""Tests for ComponentRegistry."""
+
+import importlib
+
+import pytest
+
+from pudding.core.registry import ComponentRegistry
+
+# pudding.core.registry is shadowed by the global registry instance
+registry_module = importlib.import_module("pudding.core.registry")
+
+
+@pytest.fixture
+def registry() -> ComponentRegistry:
+    registry = ComponentRegistry()
+    registry.register("cleaner", "1.0.0", "TextInput", "CleanedText")
+    registry.register("counter", "1.0.0", "CleanedText", "WordStats")
+    return registry
+
+
+def test_schema_lookups(registry):
+    """Components are found by the schemas they accept and produce."""
+    assert registry.components_accepting("CleanedText") == ["counter"]
+    assert registry.components_producing("CleanedText") == ["cleaner"]
+    assert registry.components_accepting("Unknown") == []
+    assert registry.consumers_of("cleaner") == ["counter"]
+    assert registry.producers_of("counter") == ["cleaner"]
+    assert registry.consumers_of("missing") == []
+
+
+def test_can_connect(registry):
+    """Matching schemas connect; mismatches and unknown names explain why."""
+    assert registry.can_connect("cleaner", "counter") == (True, None)
+    ok, reason = registry.can_connect("counter", "cleaner")
+    assert not ok
+    assert "Schema mismatch" in reason
+    assert registry.can_connect("cleaner", "missing") == (
+        False,
+        "Component 'missing' not registered",
+    )
+
+
+def test_reregistering_updates_indexes_and_connections(registry):
+    """Re-registering with new schemas replaces every old lookup result."""
+    assert registry.can_connect("cleaner", "counter") == (True, None)
+
+    registry.register("counter", "2.0.0", "TokenizedText", "WordStats")
+
+    assert registry.components_accepting("CleanedText") == []
+    assert registry.components_accepting("TokenizedText") == ["counter"]
+    assert registry.components_producing("WordStats") == ["counter"]
+    assert registry.consumers_of("cleaner") == []
+    assert registry.producers_of("counter") == []
+    assert registry.can_connect("cleaner", "counter")[0] is False
+    assert registry.list_components() == ["cleaner", "counter"]
+
+
+def test_registering_a_missing_component_updates_cached_result(registry):
+    """A cached 'not registered' answer is dropped once the component exists."""
+    assert registry.can_connect("counter", "reporter")[0] is False
+
+    registry.register("reporter", "1.0.0", "WordStats", "Report")
+
+    assert registry.can_connect("counter", "reporter") == (True, None)
+    assert registry.consumers_of("counter") == ["reporter"]
+
+
+def test_reregistering_unchanged_component_keeps_cache(registry):
+    """Registering identical details again leaves cached answers in place."""
+    registry.can_connect("cleaner", "counter")
+
+    registry.register("counter", "1.0.0", "CleanedText", "WordStats")
+
+    assert ("cleaner", "counter") in registry._connect_cache
+    assert registry.components_accepting("CleanedText") == ["counter"]
+
+
+def test_connect_cache_is_bounded(registry, monkeypatch):
+    """The least recently used can_connect() result is dropped when full."""
+    monkeypatch.setattr(registry_module, "CONNECT_CACHE_SIZE", 2)
+
+    registry.can_connect("cleaner", "counter")
+    registry.can_connect("counter", "cleaner")
+    registry.can_connect("cleaner", "counter")  # now most recently used
+    registry.can_connect("cleaner", "cleaner")
+
+    assert list(registry._connect_cache) == [
+        ("cleaner", "counter"),
+        ("cleaner", "cleaner"),
+    ]
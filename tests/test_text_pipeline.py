@@ -0,0 +1,32 @@
+"""Tests for the text pipeline example components."""
+
+from pathlib import Path
+
+import pytest
+
+EXAMPLE_DIR = Path(__file__).parent.parent / "examples" / "text_pipeline"
+
+
+@pytest.fixture
+def components(monkeypatch):
+    monkeypatch.syspath_prepend(str(EXAMPLE_DIR))
+    import components
+
+    return components
+
+
+async def test_approximate_word_counts_match_exact(components):
+    """bounter-backed counting agrees with Counter on a small text."""
+    pytest.importorskip("bounter")
+    cleaned = components.CleanedText(text="the cat and the hat and the bat")
+
+    counter = components.WordCounter(approximate=True, size_mb=1)
+    assert counter.approximate
+
+    exact = await components.WordCounter().process(cleaned)
+    approximate = await counter.process(cleaned)
+
+    assert approximate.total_words == exact.total_words == 8
+    assert approximate.unique_words == exact.unique_words == 5
+    assert approximate.average_word_length == exact.average_word_length
+    assert approximate.most_common_words[:2] == [("the", 3), ("and", 2)]